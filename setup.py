@@ -1,7 +1,3 @@
-# -*- coding: utf-8 -*-
-
-from __future__ import unicode_literals
-
 import os
 from setuptools import setup
 
@@ -38,5 +34,4 @@ setup(
     py_modules=['sms_plusserver'],
     install_requires=['requests >= 2.25'],
     test_suite='tests',
-    tests_require=['mock'],
 )
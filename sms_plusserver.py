@@ -1,10 +1,17 @@
+import asyncio
+import base64
 import collections
-import datetime
+import functools
 import logging
-from typing import Optional, Union
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Union
 
 import requests
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
 
 logger = logging.getLogger('sms_plusserver')
@@ -16,10 +23,20 @@ STATE_ARRIVED = 'arrived'
 STATE_RETRY = 'retry'
 STATE_ERROR = 'error'
 
+# SMS states, which never change:
+TERMINAL_STATES = frozenset({STATE_ARRIVED, STATE_ERROR})
+
 # SMS response message choices:
 MESSAGE_OK = 'REQUEST OK'
 MESSAGE_ERROR = 'ERROR'
 
+# HTTP statuses, which denote transient failures worth retrying (request
+# rejected before being processed by the platform):
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504, 529})
+# HTTP statuses which mean that a request was rejected without processing,
+# so it can be retried even if it is not idempotent (unlike gateway errors):
+REJECTED_STATUS_CODES = frozenset({429, 503, 529})
+
 
 class SMSServiceError(Exception):
     """Base exception class"""
@@ -56,21 +73,33 @@ class RequestError(SMSServiceError):
     """API responded with an error"""
 
 
-class SMSResponse(object):
+class SMSResponse:
     """Wrapper over SMSService response data, providing dict-like access"""
 
+    __slots__ = ('message', '_params_text', '_params')
+
     def __init__(self, response_text: str):
-        lines = response_text.splitlines()
-        self.message = lines.pop(0) if lines else ''
-        self._data = collections.OrderedDict()
-        for line in lines:
-            if '=' in line:
-                key, value = line.split('=', 1)
-                self._data[key.strip()] = value.strip()
+        message, _, self._params_text = response_text.partition('\n')
+        self.message = message.rstrip('\r')
+        self._params = None
 
     def __repr__(self):
         return f'<{self.__class__.__name__} [{self.message or ""}]>'
 
+    @property
+    def _data(self) -> dict:
+        """Response parameters, parsed on first access"""
+        if self._params is None:
+            self._params = {
+                key.strip(): value.strip()
+                for key, separator, value in (
+                    line.partition('=')
+                    for line in self._params_text.splitlines()
+                )
+                if separator
+            }
+        return self._params
+
     def __getitem__(self, item):
         return self._data[item]
 
@@ -113,12 +142,69 @@ class SMSResponse(object):
         return self.message == MESSAGE_ERROR
 
 
-class SMSService(object):
+class _CircuitBreaker:
+    """Fails API calls fast while the platform is unavailable.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    are rejected without any network I/O. Once `reset_timeout` seconds have
+    passed, a single probe call is let through - its outcome either closes
+    the circuit or opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Should the next call be sent to the platform?"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self.opened_at = now
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failure_count = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failure_count += 1
+            if (
+                self.state == self.HALF_OPEN
+                or self.failure_count >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class SMSService:
     """Main object - provider's API client"""
 
     SMS_PUT_URL = 'https://sms.plusserver.com/put.php'
     SMS_STATE_URL = 'https://sms.plusserver.com/sms-state.php'
     CHECK_STATE_WAIT_BETWEEN_CALLS = 0.5
+    CHECK_STATE_MAX_WAIT = 8.0
+    CHECK_STATE_JITTER = 0.2
+    CHECK_STATE_FINAL_TIMEOUT = 1.0
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 32
+    CIRCUIT_BREAKER_THRESHOLD = 5
+    CIRCUIT_BREAKER_RESET_TIMEOUT = 30.0
 
     def __init__(
         self,
@@ -131,6 +217,13 @@ class SMSService(object):
         encoding: Optional[str] = None,
         max_parts: Optional[int] = None,
         timeout: Optional[float] = None,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: float = 0.5,
+        poll_schedule: Optional[Sequence[float]] = None,
+        state_cache_ttl: float = 0,
+        state_cache_maxsize: int = 1024,
     ):
         """Initializes SMSService object
 
@@ -147,6 +240,24 @@ class SMSService(object):
             text-SMS (>160 chars) will be split
             (optional, implicit default - 1)
         :param timeout: network timeout in seconds (optional)
+        :param max_retries: number of retries of API calls failed due to
+            connection errors or transient HTTP error statuses
+            (optional, default - 3)
+        :param retry_base_delay: delay in seconds before the first retry,
+            doubled with each subsequent retry (optional, default - 1.0)
+        :param retry_max_delay: upper limit of delay between retries
+            in seconds (optional, default - 30.0)
+        :param retry_jitter: relative random deviation of retry delay
+            (optional, default - 0.5)
+        :param poll_schedule: delays in seconds between subsequent SMS state
+            checks made while waiting for arrival, used exactly as given;
+            the last one is repeated (optional, default - exponential
+            backoff from 0.5 up to 8.0, with random jitter)
+        :param state_cache_ttl: number of seconds for which SMS state
+            responses are cached, responses with terminal state are kept
+            until evicted (optional, default - 0, no caching)
+        :param state_cache_maxsize: maximum number of cached SMS state
+            responses (optional, default - 1024)
         """
         self.put_url = put_url or self.SMS_PUT_URL
         self.sms_state_url = sms_state_url or self.SMS_STATE_URL
@@ -157,14 +268,75 @@ class SMSService(object):
         self.encoding = encoding
         self.max_parts = max_parts
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_jitter = retry_jitter
+        self.poll_schedule = poll_schedule
+        self.state_cache_ttl = state_cache_ttl
+        self.state_cache_maxsize = state_cache_maxsize
+        self._lock = threading.RLock()
+        self._auth_credentials = None
+        self._auth_headers = None
+        self._circuit_breaker = _CircuitBreaker(
+            self.CIRCUIT_BREAKER_THRESHOLD, self.CIRCUIT_BREAKER_RESET_TIMEOUT
+        )
+        self._session = None
+        self._state_cache = collections.OrderedDict()
+        self._state_cache_lock = threading.Lock()
 
     def __repr__(self):
         project = f' @ {self.project}' if self.project else ''
         return f'<{self.__class__.__name__} {self.username}{project}>'
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _create_session(self) -> requests.Session:
+        """Creates HTTP session, keeping connections to the platform alive
+        between subsequent API calls.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            pool_block=False,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _get_session(self) -> requests.Session:
+        """Returns HTTP session, creating it on first use."""
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+        return session
+
+    def close(self):
+        """Closes HTTP session, releasing all pooled connections.
+        A new session is created if the service is used again.
+        """
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
     def configure(self, **kwargs):
         """Allows to change SMSService parameters set in constructor.
 
+        Changes are applied atomically with respect to API calls made by other
+        threads - `put_sms` and `check_sms_state` read URLs, credentials,
+        timeout and message defaults in one consistent snapshot. Once
+        configured, a service (and its pooled connections) can be shared by
+        many threads concurrently.
+
         Available options:
         `put_url`: SMS sending webservice URL
         `sms_state_url`: SMS state check webservice URL
@@ -173,9 +345,20 @@ class SMSService(object):
         `password`: password for access to Plusserver platform - REQUIRED
         `orig`: SMS sender ID (optional)
         `timeout`: network timeout in seconds (optional)
+        `max_retries`: number of retries of failed API calls (optional)
+        `retry_base_delay`: delay in seconds before the first retry (optional)
+        `retry_max_delay`: upper limit of delay between retries (optional)
+        `retry_jitter`: relative random deviation of retry delay (optional)
+        `poll_schedule`: delays between SMS state checks made while waiting
+            for arrival (optional)
+        `state_cache_ttl`: number of seconds for which SMS state responses
+            are cached (optional)
+        `state_cache_maxsize`: maximum number of cached SMS state responses
+            (optional)
         """
-        for name, value in kwargs.items():
-            setattr(self, name, value)
+        with self._lock:
+            for name, value in kwargs.items():
+                setattr(self, name, value)
 
     # High-level API:
 
@@ -223,6 +406,46 @@ class SMSService(object):
             result = bool(put_response and put_response.is_ok)
         return result
 
+    def send_many(
+        self,
+        sms_list: Iterable['SMS'],
+        concurrency: int = 16,
+        timeout: Optional[float] = None,
+        fail_silently: bool = False,
+    ) -> List[Union[str, bool, None, SMSServiceError]]:
+        """Sends multiple SMS concurrently, using a pool of `concurrency`
+        threads sharing this service's HTTP connections.
+        Populates `SMS.put_response` attribute of each message.
+
+        Failure of a single message does not interrupt sending of the others -
+        exceptions raised while sending a message are returned in place of
+        its result.
+
+        Concurrency is limited to `POOL_MAXSIZE`, so that every thread reuses
+        a pooled connection; it should also stay within the rate limit of
+        your Plusserver account.
+
+        :param sms_list: SMS instances
+        :param concurrency: maximum number of messages sent simultaneously
+        :param timeout: network timeout in seconds
+        :param fail_silently: do not raise exceptions
+
+        :return list of results of `send` (or exceptions), in order of
+            `sms_list`
+        """
+
+        def send(sms):
+            try:
+                return self.send(
+                    sms, timeout=timeout, fail_silently=fail_silently
+                )
+            except SMSServiceError as error:
+                return error
+
+        max_workers = min(concurrency, self.POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(send, sms_list))
+
     def check_state(
         self,
         sms: 'SMS',
@@ -302,38 +525,39 @@ class SMSService(object):
 
         :return a SMSResponse object or None
         """
-        if not (self.username and self.password):
-            raise ConfigurationError('Service credentials not defined')
-
-        auth = (self.username, self.password)
+        # Read configuration consistently with concurrent `configure` calls
+        with self._lock:
+            headers = self._get_auth_headers()
+            url = self.put_url
+            project = project or self.project
+            orig = orig or self.orig
+            encoding = encoding or self.encoding
+            max_parts = max_parts or self.max_parts
+            if timeout is None:
+                timeout = self.timeout
 
         data = {
             'dest': destination,
             'data': text,
-            'debug': str(int(debug)),
-            'project': project or self.project,
-            'registered_delivery': str(int(registered_delivery)),
+            'debug': '1' if debug else '0',
+            'project': project,
+            'registered_delivery': '1' if registered_delivery else '0',
         }
-        orig = orig or self.orig
         if orig:
             data['orig'] = orig
-        encoding = encoding or self.encoding
         if encoding:
             data['enc'] = encoding
-        max_parts = max_parts or self.max_parts
         if max_parts:
             data['maxparts'] = str(max_parts)
 
-        if timeout is None:
-            timeout = self.timeout
-
         return self._request(
-            url=self.put_url,
+            url=url,
             data=data,
-            auth=auth,
+            headers=headers,
             timeout=timeout,
             resource_name='Put SMS',
             fail_silently=fail_silently,
+            idempotent=False,
         )
 
     def check_sms_state(
@@ -341,12 +565,20 @@ class SMSService(object):
         handle_id: str,
         timeout: Optional[float] = None,
         fail_silently: bool = False,
+        use_cache: bool = True,
+        max_retries: Optional[int] = None,
     ) -> Optional[SMSResponse]:
         """Checks state of given SMS (Handle ID) on Plusserver SMS platform.
+        When `state_cache_ttl` is set, recently received (or terminal) state
+        responses are served from cache.
 
         :param handle_id: SMS unique identifier on Plusserver platform
         :param timeout: network timeout in seconds
         :param fail_silently: do not raise exceptions
+        :param use_cache: serve state from cache if available - otherwise
+            state is always requested from the platform (and cached)
+        :param max_retries: number of retries of failed API call
+            (optional, default - service's `max_retries`)
 
         :raise ConfigurationError: client is improperly configured
         :raise ValidationError: invalid request attempt
@@ -356,26 +588,34 @@ class SMSService(object):
 
         :return a SMSResponse object or None
         """
-        if not (self.username and self.password):
-            raise ConfigurationError('Service credentials not defined')
+        # Read configuration consistently with concurrent `configure` calls
+        with self._lock:
+            headers = self._get_auth_headers()
+            url = self.sms_state_url
+            if timeout is None:
+                timeout = self.timeout
         if not handle_id:
             raise ValidationError('Unable to check state of unsent SMS')
 
-        auth = (self.username, self.password)
+        if use_cache:
+            state_response = self._get_cached_state(handle_id)
+            if state_response is not None:
+                return state_response
 
         data = {'handle': handle_id}
 
-        if timeout is None:
-            timeout = self.timeout
-
-        return self._request(
-            url=self.sms_state_url,
+        state_response = self._request(
+            url=url,
             data=data,
-            auth=auth,
+            headers=headers,
             timeout=timeout,
             resource_name='Check SMS state',
             fail_silently=fail_silently,
+            max_retries=max_retries,
         )
+        if state_response is not None:
+            self._cache_state(handle_id, state_response)
+        return state_response
 
     def wait_until_arrived(
         self,
@@ -385,6 +625,11 @@ class SMSService(object):
     ) -> Optional[SMSResponse]:
         """Waits until SMS (Handle ID) gets 'arrived' state on Plusserver SMS
         platform.
+        When the next delay would exceed the timeout, the state is checked
+        once more just before the deadline, leaving it up to
+        CHECK_STATE_FINAL_TIMEOUT seconds of network timeout. State checks failed due to connection
+        errors or transient HTTP errors are not retried right away - state is
+        checked again after the next delay.
 
         :param handle_id: SMS unique identifier on Plusserver platform
         :param timeout: network timeout in seconds
@@ -399,59 +644,160 @@ class SMSService(object):
         :return a SMSResponse object or None
         """
         remaining_timeout = timeout if timeout else self.timeout
-        start = datetime.datetime.now()
+        start = time.monotonic()
         state_response = None
-        while remaining_timeout is None or remaining_timeout > 0:
-            step_start = datetime.datetime.now()
+        poll_index = 0
+        check_timeout = remaining_timeout
+        final_check = False
+        while True:
+            step_start = time.monotonic()
             try:
+                # Failed checks are not retried with backoff, which would not
+                # respect the timeout - state is checked again on next poll
                 state_response = self.check_sms_state(
-                    handle_id, timeout=remaining_timeout, fail_silently=False
+                    handle_id,
+                    timeout=check_timeout,
+                    fail_silently=False,
+                    use_cache=False,
+                    max_retries=0,
                 )
             except SMSServiceError as error:
-                if not error.is_timeout() and not fail_silently:
-                    raise
-                else:
+                if error.is_timeout():
+                    break
+                original_exception = error.original_exception
+                if original_exception is None or not self._is_retriable(
+                    original_exception
+                ):
+                    if not fail_silently:
+                        raise
                     break
+                logger.warning(
+                    'SMS [%s] state check failed: %s', handle_id, error
+                )
             else:
-                step_end = datetime.datetime.now()
                 if state_response.state == STATE_ARRIVED:
                     logger.debug(
-                        'SMS [{}] arrived. Total delay: {}'.format(
-                            handle_id, step_end - start
-                        )
+                        'SMS [%s] arrived. Total delay: %.3fs',
+                        handle_id,
+                        time.monotonic() - start,
                     )
                     break
                 logger.debug(
-                    'SMS [{}] not arrived yet. Total delay: {}'.format(
-                        handle_id, step_end - start
-                    )
+                    'SMS [%s] not arrived yet. Total delay: %.3fs',
+                    handle_id,
+                    time.monotonic() - start,
+                )
+            step_end = time.monotonic()
+            if final_check:
+                break
+            wait_secs = self._get_check_state_delay(poll_index)
+            poll_index += 1
+            if remaining_timeout is not None:
+                remaining_timeout -= step_end - step_start
+                if remaining_timeout <= 0:
+                    break
+                # Leave time for the last check before the deadline
+                final_check_timeout = min(
+                    remaining_timeout, self.CHECK_STATE_FINAL_TIMEOUT
                 )
-                if remaining_timeout is not None:
-                    step_duration = step_start - step_end
-                    remaining_timeout -= step_duration.total_seconds()
-                    wait_secs = self.CHECK_STATE_WAIT_BETWEEN_CALLS
-                    if remaining_timeout > wait_secs * 1.5:
-                        time.sleep(wait_secs)
+                if remaining_timeout - wait_secs < final_check_timeout:
+                    wait_secs = remaining_timeout - final_check_timeout
+                    final_check = True
+                remaining_timeout -= wait_secs
+                check_timeout = remaining_timeout
+            time.sleep(wait_secs)
         return state_response
 
-    @staticmethod
+    def _get_check_state_delay(self, poll_index: int) -> float:
+        """Calculates delay in seconds before next SMS state check.
+        Delays set in `poll_schedule` are used as given. Otherwise, delay
+        grows exponentially, so that fast arrivals are detected quickly while
+        slow ones do not flood the platform with requests.
+        """
+        poll_schedule = self.poll_schedule
+        if poll_schedule:
+            return poll_schedule[min(poll_index, len(poll_schedule) - 1)]
+        delay = self.CHECK_STATE_WAIT_BETWEEN_CALLS * 2 ** poll_index
+        delay = min(self.CHECK_STATE_MAX_WAIT, delay)
+        jitter = self.CHECK_STATE_JITTER
+        return delay * (1 + random.uniform(-jitter, jitter))
+
+    def _get_cached_state(self, handle_id: str) -> Optional[SMSResponse]:
+        """Returns cached state response of given SMS, if still valid."""
+        if not self.state_cache_ttl:
+            return None
+        with self._state_cache_lock:
+            cached = self._state_cache.get(handle_id)
+            if cached is None:
+                return None
+            cached_at, state_response = cached
+            age = time.monotonic() - cached_at
+            if (
+                state_response.state not in TERMINAL_STATES
+                and age >= self.state_cache_ttl
+            ):
+                del self._state_cache[handle_id]
+                return None
+            self._state_cache.move_to_end(handle_id)
+            return state_response
+
+    def _cache_state(self, handle_id: str, state_response: SMSResponse):
+        """Stores state response of given SMS, evicting least recently
+        used entries over `state_cache_maxsize`.
+        """
+        if not self.state_cache_ttl:
+            return
+        with self._state_cache_lock:
+            self._state_cache[handle_id] = (time.monotonic(), state_response)
+            self._state_cache.move_to_end(handle_id)
+            while len(self._state_cache) > self.state_cache_maxsize:
+                self._state_cache.popitem(last=False)
+
+    def _get_auth_headers(self) -> dict:
+        """Returns HTTP Basic Auth headers, read consistently with
+        concurrent `configure` calls. Headers are encoded once and reused
+        until credentials change.
+
+        :raise ConfigurationError: credentials not defined
+        """
+        with self._lock:
+            credentials = (self.username, self.password)
+            if not all(credentials):
+                raise ConfigurationError('Service credentials not defined')
+            if credentials != self._auth_credentials:
+                token = base64.b64encode(
+                    '{}:{}'.format(*credentials).encode('latin-1')
+                )
+                self._auth_headers = {
+                    'Authorization': 'Basic {}'.format(token.decode('ascii'))
+                }
+                self._auth_credentials = credentials
+            return self._auth_headers
+
     def _request(
+        self,
         url: str,
         data: dict,
-        auth: dict,
+        headers: dict,
         timeout: float,
         resource_name: str,
         fail_silently: bool,
+        idempotent: bool = True,
+        max_retries: Optional[int] = None,
     ) -> Optional[SMSResponse]:
         """Sends a request to Service API, construct SMSResponse object from
         response.
 
         :param url: destination's URL address
         :param data: POST data
-        :param auth: HTTP Basic Auth data
+        :param headers: HTTP headers, including Basic Auth
         :param timeout: network timeout in seconds
         :param resource_name: destination's verbose name (for logging)
         :param fail_silently: do not raise exceptions
+        :param idempotent: whether the request may be repeated after
+            a connection broken while it was being sent
+        :param max_retries: number of retries of failed request
+            (optional, default - service's `max_retries`)
 
         :raise RequestError: remote API responded with error message or
             HTTP error status
@@ -459,15 +805,32 @@ class SMSService(object):
 
         :return a SMSResponse object or None
         """
+        if not self._circuit_breaker.allow_request():
+            exception = CommunicationError(
+                '{} suspended after repeated failures to reach the '
+                'platform'.format(resource_name)
+            )
+            logger.error(exception)
+            if not fail_silently:
+                raise exception
+            return None
+
         try:
-            response = requests.post(url, data, auth=auth, timeout=timeout)
-            logger.debug(
-                '{} response: {} {}'.format(
-                    resource_name, response.status_code, response.reason
-                )
+            response = self._post(
+                url,
+                data,
+                headers,
+                timeout,
+                resource_name,
+                idempotent,
+                max_retries,
             )
-            response.raise_for_status()
         except requests.RequestException as error:
+            if self._is_platform_failure(error):
+                self._circuit_breaker.record_failure()
+            elif isinstance(error, requests.HTTPError):
+                # The platform is up, just rejected the request
+                self._circuit_breaker.record_success()
             if isinstance(error, requests.HTTPError):
                 exception_class = RequestError
             else:
@@ -479,6 +842,11 @@ class SMSService(object):
             if not fail_silently:
                 raise exception
         else:
+            self._circuit_breaker.record_success()
+            if response.encoding is None:
+                # Skip costly charset detection when no charset is declared,
+                # the platform responds with plain text "key = value" lines
+                response.encoding = 'utf-8'
             sms_response = SMSResponse(response.text)
             if sms_response.is_error:
                 exception = RequestError(sms_response.error)
@@ -490,13 +858,139 @@ class SMSService(object):
 
         return sms_response
 
+    def _post(
+        self,
+        url: str,
+        data: dict,
+        headers: dict,
+        timeout: float,
+        resource_name: str,
+        idempotent: bool = True,
+        max_retries: Optional[int] = None,
+    ) -> requests.Response:
+        """Sends a POST request to Service API, retrying it with exponential
+        backoff on connection errors and transient HTTP error statuses.
+
+        Read timeouts are not retried - the platform may have already
+        accepted the request. For the same reason, requests which are not
+        idempotent are retried only when the connection failed before
+        sending them.
+
+        :param url: destination's URL address
+        :param data: POST data
+        :param headers: HTTP headers, including Basic Auth
+        :param timeout: network timeout in seconds
+        :param resource_name: destination's verbose name (for logging)
+        :param idempotent: whether the request may be repeated after
+            a connection broken while it was being sent
+        :param max_retries: number of retries of failed request
+            (optional, default - service's `max_retries`)
+
+        :raise requests.RequestException: request failed after all retries
+
+        :return a successful HTTP response
+        """
+        if max_retries is None:
+            max_retries = self.max_retries
+        attempt = 0
+        while True:
+            try:
+                response = self._get_session().post(
+                    url, data=data, headers=headers, timeout=timeout
+                )
+                logger.debug(
+                    '%s response: %s %s',
+                    resource_name,
+                    response.status_code,
+                    response.reason,
+                )
+                response.raise_for_status()
+            except requests.RequestException as error:
+                retriable = self._is_retriable(error, idempotent)
+                if not retriable or attempt >= max_retries:
+                    raise
+                delay = self._get_retry_delay(attempt, error)
+                logger.warning(
+                    '%s failed: %s. Retrying in %.2fs',
+                    resource_name,
+                    error,
+                    delay,
+                )
+                time.sleep(delay)
+                attempt += 1
+            else:
+                return response
+
+    @staticmethod
+    def _is_retriable(
+        error: requests.RequestException, idempotent: bool = True
+    ) -> bool:
+        """Is given request error transient and safe to retry?"""
+        if isinstance(error, requests.HTTPError):
+            response = error.response
+            if idempotent:
+                status_codes = RETRY_STATUS_CODES
+            else:
+                status_codes = REJECTED_STATUS_CODES
+            return (
+                response is not None and response.status_code in status_codes
+            )
+        if not isinstance(error, requests.ConnectionError):
+            return False
+        if idempotent or isinstance(error, requests.ConnectTimeout):
+            return True
+        # Unless the connection could not be established, the request may
+        # have reached the platform already
+        reason = error.args[0] if error.args else None
+        reason = getattr(reason, 'reason', reason)
+        return isinstance(reason, NewConnectionError)
+
+    @staticmethod
+    def _is_platform_failure(error: requests.RequestException) -> bool:
+        """Does given request error indicate that the platform is down?
+        Client-side errors (e.g. invalid URL) do not.
+        """
+        if isinstance(error, requests.HTTPError):
+            response = error.response
+            return response is not None and response.status_code >= 500
+        return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+    def _get_retry_delay(
+        self, attempt: int, error: requests.RequestException
+    ) -> float:
+        """Calculates delay in seconds before next retry. Honors
+        `Retry-After` header sent along with HTTP error status.
+        """
+        response = getattr(error, 'response', None)
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(self.retry_max_delay, float(retry_after))
+        delay = self.retry_base_delay * 2 ** attempt
+        delay = min(self.retry_max_delay, delay)
+        jitter = random.uniform(-self.retry_jitter, self.retry_jitter)
+        return delay * (1 + jitter)
+
 
 default_service = SMSService()
 
 
-class SMS(object):
+class SMS:
     """Single message wrapper"""
 
+    __slots__ = (
+        'destination',
+        'text',
+        'orig',
+        'registered_delivery',
+        'debug',
+        'project',
+        'encoding',
+        'max_parts',
+        'put_response',
+        'state_response',
+    )
+
     def __init__(
         self,
         destination: str,
@@ -661,6 +1155,33 @@ def send_sms(
     )
 
 
+def send_bulk_sms(
+    sms_list: Iterable[SMS],
+    concurrency: int = 16,
+    timeout: Optional[float] = None,
+    fail_silently: bool = False,
+    service: Optional[SMSService] = None,
+) -> List[Union[str, bool, None, SMSServiceError]]:
+    """Shortcut to send multiple SMS concurrently.
+
+    :param sms_list: SMS instances
+    :param concurrency: maximum number of messages sent simultaneously
+    :param timeout: network timeout in seconds
+    :param fail_silently: do not raise exceptions
+    :param service: a SMSService instance
+
+    :return list of results of sending each message (handle_id or boolean
+        success indicator) or exceptions raised, in order of `sms_list`
+    """
+    service = service or default_service
+    return service.send_many(
+        sms_list,
+        concurrency=concurrency,
+        timeout=timeout,
+        fail_silently=fail_silently,
+    )
+
+
 def check_sms_state(
     handle_id: str,
     timeout: Optional[float] = None,
@@ -717,6 +1238,74 @@ def wait_until_arrived(
     return state_response.state if state_response else None
 
 
+async def send_sms_async(
+    destination: str,
+    text: str,
+    orig: Optional[str] = None,
+    registered_delivery: bool = True,
+    debug: bool = False,
+    project: Optional[str] = None,
+    encoding: Optional[str] = None,
+    max_parts: Optional[int] = None,
+    timeout: Optional[float] = None,
+    fail_silently: bool = False,
+    service: Optional[SMSService] = None,
+) -> Union[str, bool]:
+    """Coroutine version of `send_sms`.
+
+    The request is made in the default executor of the running event loop,
+    so that the loop is not blocked while waiting for the platform.
+    Accepts the same parameters and raises the same exceptions as
+    `send_sms`.
+
+    :return handle_id if available, boolean success indicator otherwise
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None,
+        functools.partial(
+            send_sms,
+            destination,
+            text,
+            orig=orig,
+            registered_delivery=registered_delivery,
+            debug=debug,
+            project=project,
+            encoding=encoding,
+            max_parts=max_parts,
+            timeout=timeout,
+            fail_silently=fail_silently,
+            service=service,
+        ),
+    )
+
+
+async def check_sms_state_async(
+    handle_id: str,
+    timeout: Optional[float] = None,
+    fail_silently: bool = False,
+    service: Optional[SMSService] = None,
+) -> Optional[str]:
+    """Coroutine version of `check_sms_state`.
+
+    Accepts the same parameters and raises the same exceptions as
+    `check_sms_state`.
+
+    :return state if available, None otherwise
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None,
+        functools.partial(
+            check_sms_state,
+            handle_id,
+            timeout=timeout,
+            fail_silently=fail_silently,
+            service=service,
+        ),
+    )
+
+
 def configure(**kwargs):
     """Configures default SMSService instance.
 
@@ -728,5 +1317,15 @@ def configure(**kwargs):
     `password`: password for access to Plusserver platform - REQUIRED
     `orig`: SMS sender ID (optional)
     `timeout`: network timeout in seconds (optional)
+    `max_retries`: number of retries of failed API calls (optional)
+    `retry_base_delay`: delay in seconds before the first retry (optional)
+    `retry_max_delay`: upper limit of delay between retries (optional)
+    `retry_jitter`: relative random deviation of retry delay (optional)
+    `poll_schedule`: delays between SMS state checks made while waiting
+        for arrival (optional)
+    `state_cache_ttl`: number of seconds for which SMS state responses are
+        cached (optional)
+    `state_cache_maxsize`: maximum number of cached SMS state responses
+        (optional)
     """
     default_service.configure(**kwargs)
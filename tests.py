@@ -1,7 +1,11 @@
+import asyncio
+import http.client
+import threading
 import unittest
+from unittest import mock
 
-import mock
 import requests
+import urllib3
 
 import sms_plusserver
 
@@ -41,6 +45,13 @@ class SMSResponseTestCase(unittest.TestCase):
         self.assertEqual(response.message, 'REQUEST OK')
         self.assertEqual(list(response.items()), [('A', '42'), ('C D', '')])
 
+    def test_message_and_params_crlf(self):
+        response = sms_plusserver.SMSResponse(
+            'REQUEST OK\r\nA = 42\r\nB = X Y\r\n'
+        )
+        self.assertEqual(response.message, 'REQUEST OK')
+        self.assertEqual(list(response.items()), [('A', '42'), ('B', 'X Y')])
+
     def test_iter_empty(self):
         response = sms_plusserver.SMSResponse('Unauthorized')
         self.assertEqual([key for key in response], [])
@@ -82,6 +93,29 @@ class SMSResponseTestCase(unittest.TestCase):
         )
         self.assertEqual(response['B'], 'X Y')
 
+    def test_lazy_params_parsing(self):
+        response = sms_plusserver.SMSResponse('REQUEST OK\nA = 42')
+        self.assertTrue(response.is_ok)
+        self.assertIsNone(response._params)
+        self.assertEqual(response['A'], '42')
+        self.assertEqual(response._params, {'A': '42'})
+
+    def test_lazy_params_parsing_repeated(self):
+        # Concurrent first reads may parse the response more than once
+        response = sms_plusserver.SMSResponse('REQUEST OK\nstate = arrived')
+        params_text = response._params_text
+        params = response._data
+
+        response._params = None
+
+        self.assertEqual(response._data, params)
+        self.assertIs(response._params_text, params_text)
+
+    def test_no_instance_dict(self):
+        response = sms_plusserver.SMSResponse('REQUEST OK\n')
+        with self.assertRaises(AttributeError):
+            response.extra = 42
+
     def test_handle_id_missing(self):
         response = sms_plusserver.SMSResponse('REQUEST OK\n')
         self.assertIsNone(response.handle_id)
@@ -115,6 +149,53 @@ class SMSResponseTestCase(unittest.TestCase):
         )
 
 
+class CircuitBreakerTestCase(unittest.TestCase):
+    """Tests for `_CircuitBreaker` class"""
+
+    def test_closed(self):
+        breaker = sms_plusserver._CircuitBreaker(2, 30.0)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, breaker.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_success_resets_failures(self):
+        breaker = sms_plusserver._CircuitBreaker(2, 30.0)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, breaker.CLOSED)
+
+    @mock.patch('sms_plusserver.time.monotonic', return_value=100.0)
+    def test_open(self, mock_monotonic):
+        breaker = sms_plusserver._CircuitBreaker(2, 30.0)
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, breaker.OPEN)
+
+        mock_monotonic.return_value = 129.0
+        self.assertFalse(breaker.allow_request())
+
+    @mock.patch('sms_plusserver.time.monotonic', return_value=100.0)
+    def test_half_open_probe(self, mock_monotonic):
+        breaker = sms_plusserver._CircuitBreaker(2, 30.0)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        mock_monotonic.return_value = 130.0
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, breaker.HALF_OPEN)
+        self.assertFalse(breaker.allow_request())  # single probe only
+
+        breaker.record_failure()
+        self.assertEqual(breaker.state, breaker.OPEN)
+
+        mock_monotonic.return_value = 160.0
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, breaker.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+
 class SMSServiceTestCase(unittest.TestCase):
     """Tests for `SMSService` class"""
 
@@ -215,6 +296,13 @@ class SMSServiceTestCase(unittest.TestCase):
         custom_encoding = 'utf-8'
         custom_max_parts = 3
         custom_timeout = 30
+        custom_max_retries = 5
+        custom_retry_base_delay = 0.5
+        custom_retry_max_delay = 10.0
+        custom_retry_jitter = 0.1
+        custom_poll_schedule = [5, 30, 60]
+        custom_state_cache_ttl = 2
+        custom_state_cache_maxsize = 100
 
         service = sms_plusserver.SMSService()
         service.configure(
@@ -227,6 +315,13 @@ class SMSServiceTestCase(unittest.TestCase):
             encoding=custom_encoding,
             max_parts=custom_max_parts,
             timeout=custom_timeout,
+            max_retries=custom_max_retries,
+            retry_base_delay=custom_retry_base_delay,
+            retry_max_delay=custom_retry_max_delay,
+            retry_jitter=custom_retry_jitter,
+            poll_schedule=custom_poll_schedule,
+            state_cache_ttl=custom_state_cache_ttl,
+            state_cache_maxsize=custom_state_cache_maxsize,
         )
 
         self.assertEqual(service.put_url, custom_put_url)
@@ -238,10 +333,94 @@ class SMSServiceTestCase(unittest.TestCase):
         self.assertEqual(service.encoding, custom_encoding)
         self.assertEqual(service.max_parts, custom_max_parts)
         self.assertEqual(service.timeout, custom_timeout)
+        self.assertEqual(service.max_retries, custom_max_retries)
+        self.assertEqual(service.retry_base_delay, custom_retry_base_delay)
+        self.assertEqual(service.retry_max_delay, custom_retry_max_delay)
+        self.assertEqual(service.retry_jitter, custom_retry_jitter)
+        self.assertEqual(service.poll_schedule, custom_poll_schedule)
+        self.assertEqual(service.state_cache_ttl, custom_state_cache_ttl)
+        self.assertEqual(
+            service.state_cache_maxsize, custom_state_cache_maxsize
+        )
+
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_configure_consistent_with_concurrent_calls(self, mock_post):
+        type(mock_post.return_value).text = mock.PropertyMock(
+            return_value='REQUEST OK\nhandle = abc'
+        )
+        service = sms_plusserver.SMSService(username='user', password='pass')
+        sender = threading.Thread(
+            target=service.put_sms, args=('+4911122233344', 'Hello!')
+        )
+
+        # Simulate `configure` call in progress in another thread
+        with service._lock:
+            service.put_url = 'http://localhost:8000/put.php'
+            sender.start()
+            sender.join(0.1)
+            self.assertTrue(sender.is_alive())
+            service.timeout = 30
+        sender.join()
+
+        mock_post.assert_called_once()
+        self.assertEqual(
+            mock_post.call_args.args[0], 'http://localhost:8000/put.php'
+        )
+        self.assertEqual(mock_post.call_args.kwargs['timeout'], 30)
+
+    def test_auth_headers(self):
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        headers = service._get_auth_headers()
+
+        self.assertEqual(headers, {'Authorization': 'Basic dXNlcjpwYXNz'})
+        self.assertIs(service._get_auth_headers(), headers)
+
+        service.configure(password='secret')
+        self.assertEqual(
+            service._get_auth_headers(),
+            {'Authorization': 'Basic dXNlcjpzZWNyZXQ='},
+        )
+
+    def test_session_lazy(self):
+        service = sms_plusserver.SMSService()
+        self.assertIsNone(service._session)
+
+        session = service._get_session()
+
+        self.assertIsInstance(session, sms_plusserver.requests.Session)
+        self.assertIs(service._get_session(), session)
+
+    @mock.patch('sms_plusserver.requests.Session.close')
+    def test_close(self, mock_close):
+        service = sms_plusserver.SMSService()
+        session = service._get_session()
+
+        service.close()
+
+        mock_close.assert_called_once_with()
+        self.assertIsNot(service._get_session(), session)
+
+    @mock.patch('sms_plusserver.requests.Session.close')
+    def test_close_unused(self, mock_close):
+        service = sms_plusserver.SMSService()
+
+        service.close()
+
+        mock_close.assert_not_called()
+
+    @mock.patch('sms_plusserver.requests.Session.close')
+    def test_context_manager(self, mock_close):
+        with sms_plusserver.SMSService() as service:
+            self.assertIsInstance(service, sms_plusserver.SMSService)
+            service._get_session()
+            mock_close.assert_not_called()
+
+        mock_close.assert_called_once_with()
 
     # Tests for `put_sms` method:
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_put_sms_ok_default_params(self, mock_post):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value=(
@@ -256,14 +435,14 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             sms_plusserver.SMSService.SMS_PUT_URL,
-            {
+            data={
                 'dest': '+4911122233344',
                 'data': 'Hello!',
                 'debug': '0',
                 'project': 'TESTPROJECT',
                 'registered_delivery': '1',
             },
-            auth=('user', 'pass'),
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertIsInstance(response, sms_plusserver.SMSResponse)
@@ -272,7 +451,7 @@ class SMSServiceTestCase(unittest.TestCase):
             response.handle_id, 'd41d8cd98f00b204e9800998ecf8427e'
         )
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_put_sms_ok_custom_params(self, mock_post):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value=(
@@ -297,7 +476,7 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             sms_plusserver.SMSService.SMS_PUT_URL,
-            {
+            data={
                 'dest': '+4911122233344',
                 'data': 'Hello!',
                 'debug': '1',
@@ -307,7 +486,7 @@ class SMSServiceTestCase(unittest.TestCase):
                 'enc': 'utf-8',
                 'maxparts': '3',
             },
-            auth=('user', 'pass'),
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=30,
         )
         self.assertIsInstance(response, sms_plusserver.SMSResponse)
@@ -316,7 +495,7 @@ class SMSServiceTestCase(unittest.TestCase):
             response.handle_id, 'd41d8cd98f00b204e9800998ecf8427e'
         )
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_put_sms_error_missing_credentials(self, mock_post):
         service = sms_plusserver.SMSService()
 
@@ -325,7 +504,7 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_not_called()
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_put_sms_error_response(self, mock_post):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value='ERROR\nerror = Something is wrong'
@@ -339,22 +518,24 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             sms_plusserver.SMSService.SMS_PUT_URL,
-            {
+            data={
                 'dest': '+4911122233344',
                 'data': 'Hello!',
                 'debug': '0',
                 'project': 'TESTPROJECT',
                 'registered_delivery': '1',
             },
-            auth=('user', 'pass'),
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertEqual(str(raised.exception), 'Something is wrong')
 
+    @mock.patch('sms_plusserver.time.sleep')
     @mock.patch(
-        'sms_plusserver.requests.post', side_effect=requests.ConnectTimeout
+        'sms_plusserver.requests.Session.post',
+        side_effect=requests.ConnectTimeout,
     )
-    def test_put_sms_error_network(self, mock_post):
+    def test_put_sms_error_network(self, mock_post, mock_sleep):
         service = sms_plusserver.SMSService(
             username='user', password='pass', project='TESTPROJECT'
         )
@@ -362,23 +543,25 @@ class SMSServiceTestCase(unittest.TestCase):
         with self.assertRaises(sms_plusserver.CommunicationError) as raised:
             service.put_sms('+4911122233344', 'Hello!')
 
-        mock_post.assert_called_once_with(
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
+        mock_post.assert_called_with(
             sms_plusserver.SMSService.SMS_PUT_URL,
-            {
+            data={
                 'dest': '+4911122233344',
                 'data': 'Hello!',
                 'debug': '0',
                 'project': 'TESTPROJECT',
                 'registered_delivery': '1',
             },
-            auth=('user', 'pass'),
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertIsInstance(
             raised.exception.original_exception, requests.ConnectTimeout
         )
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_put_sms_error_http(self, mock_post):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value='Something is wrong'
@@ -395,24 +578,26 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             sms_plusserver.SMSService.SMS_PUT_URL,
-            {
+            data={
                 'dest': '+4911122233344',
                 'data': 'Hello!',
                 'debug': '0',
                 'project': 'TESTPROJECT',
                 'registered_delivery': '1',
             },
-            auth=('user', 'pass'),
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertIsInstance(
             raised.exception.original_exception, requests.HTTPError
         )
 
+    @mock.patch('sms_plusserver.time.sleep')
     @mock.patch(
-        'sms_plusserver.requests.post', side_effect=requests.ConnectTimeout
+        'sms_plusserver.requests.Session.post',
+        side_effect=requests.ConnectTimeout,
     )
-    def test_put_sms_error_fail_silently(self, mock_post):
+    def test_put_sms_error_fail_silently(self, mock_post, mock_sleep):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value='REQUEST ERROR\nerror = Something is wrong'
         )
@@ -424,23 +609,404 @@ class SMSServiceTestCase(unittest.TestCase):
             '+4911122233344', 'Hello!', fail_silently=True
         )
 
-        mock_post.assert_called_once_with(
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
+        mock_post.assert_called_with(
             sms_plusserver.SMSService.SMS_PUT_URL,
-            {
+            data={
                 'dest': '+4911122233344',
                 'data': 'Hello!',
                 'debug': '0',
                 'project': 'TESTPROJECT',
                 'registered_delivery': '1',
             },
-            auth=('user', 'pass'),
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertIsNone(response)
 
+    # Tests for response decoding:
+
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_request_response_without_charset(self, mock_post):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'REQUEST OK\nhandle = abc'
+        mock_post.return_value = response
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        with mock.patch(
+            'sms_plusserver.requests.Response.apparent_encoding',
+            new_callable=mock.PropertyMock,
+        ) as mock_apparent_encoding:
+            sms_response = service.put_sms('+4911122233344', 'Hello!')
+
+        mock_apparent_encoding.assert_not_called()
+        self.assertEqual(sms_response.handle_id, 'abc')
+
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_request_response_without_charset_non_ascii(self, mock_post):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = 'ERROR\nerror = Ung\u00fcltige Nummer'.encode(
+            'utf-8'
+        )
+        mock_post.return_value = response
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        with self.assertRaises(sms_plusserver.RequestError) as raised:
+            service.put_sms('+4911122233344', 'Hello!')
+
+        self.assertEqual(str(raised.exception), 'Ung\u00fcltige Nummer')
+
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_request_response_with_charset(self, mock_post):
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = 'utf-8'
+        response._content = 'REQUEST OK\nhandle = \u00e4bc'.encode('utf-8')
+        mock_post.return_value = response
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        sms_response = service.put_sms('+4911122233344', 'Hello!')
+
+        self.assertEqual(sms_response.handle_id, '\u00e4bc')
+
+    # Tests for SMS state cache:
+
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_check_sms_state_cache_disabled(self, mock_post):
+        type(mock_post.return_value).text = mock.PropertyMock(
+            return_value='REQUEST OK\nstate = processed'
+        )
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        service.check_sms_state('abc')
+        service.check_sms_state('abc')
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    @mock.patch('sms_plusserver.time.monotonic', return_value=100.0)
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_check_sms_state_cache_ttl(self, mock_post, mock_monotonic):
+        type(mock_post.return_value).text = mock.PropertyMock(
+            return_value='REQUEST OK\nstate = processed'
+        )
+        service = sms_plusserver.SMSService(
+            username='user', password='pass', state_cache_ttl=1
+        )
+
+        response = service.check_sms_state('abc')
+        mock_monotonic.return_value = 100.5
+        self.assertIs(service.check_sms_state('abc'), response)
+        self.assertEqual(mock_post.call_count, 1)
+
+        mock_monotonic.return_value = 101.0
+        self.assertIsNot(service.check_sms_state('abc'), response)
+        self.assertEqual(mock_post.call_count, 2)
+
+    @mock.patch('sms_plusserver.time.monotonic', return_value=100.0)
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_check_sms_state_cache_terminal(self, mock_post, mock_monotonic):
+        type(mock_post.return_value).text = mock.PropertyMock(
+            return_value='REQUEST OK\nstate = arrived'
+        )
+        service = sms_plusserver.SMSService(
+            username='user', password='pass', state_cache_ttl=1
+        )
+
+        response = service.check_sms_state('abc')
+        mock_monotonic.return_value = 1000.0
+
+        self.assertIs(service.check_sms_state('abc'), response)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_check_sms_state_cache_maxsize(self, mock_post):
+        type(mock_post.return_value).text = mock.PropertyMock(
+            return_value='REQUEST OK\nstate = arrived'
+        )
+        service = sms_plusserver.SMSService(
+            username='user',
+            password='pass',
+            state_cache_ttl=1,
+            state_cache_maxsize=2,
+        )
+
+        for handle_id in ['a', 'b', 'a', 'c', 'a', 'b']:
+            service.check_sms_state(handle_id)
+
+        # 'b' was evicted by 'c', as 'a' was used more recently
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual(list(service._state_cache), ['a', 'b'])
+
+    @mock.patch('sms_plusserver.random.uniform', return_value=0.0)
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_wait_until_arrived_bypasses_state_cache(
+        self, mock_post, mock_sleep, mock_uniform
+    ):
+        mock_post.side_effect = [
+            mock.MagicMock(text='REQUEST OK\nstate = processed'),
+            mock.MagicMock(text='REQUEST OK\nstate = arrived'),
+        ]
+        service = sms_plusserver.SMSService(
+            username='user',
+            password='pass',
+            poll_schedule=[1],
+            state_cache_ttl=30,
+        )
+
+        response = service.wait_until_arrived('abc', timeout=20)
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(response.state, 'arrived')
+        # Fresh state responses are still cached
+        self.assertIs(service.check_sms_state('abc'), response)
+        self.assertEqual(mock_post.call_count, 2)
+
+    # Tests for retries of failed requests:
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_request_retry_connection_error(self, mock_post, mock_sleep):
+        ok_response = mock.MagicMock(text='REQUEST OK\nstate = arrived')
+        mock_post.side_effect = [requests.ConnectTimeout, ok_response]
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        response = service.check_sms_state('d41d8cd98f00b204e9800998ecf8427e')
+
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertEqual(response.state, 'arrived')
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch(
+        'sms_plusserver.requests.Session.post',
+        side_effect=requests.ReadTimeout,
+    )
+    def test_request_no_retry_read_timeout(self, mock_post, mock_sleep):
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        with self.assertRaises(sms_plusserver.CommunicationError):
+            service.put_sms('+4911122233344', 'Hello!')
+
+        mock_post.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_put_sms_no_retry_connection_aborted(self, mock_post, mock_sleep):
+        mock_post.side_effect = requests.ConnectionError(
+            urllib3.exceptions.ProtocolError(
+                'Connection aborted.',
+                http.client.RemoteDisconnected(
+                    'Remote end closed connection without response'
+                ),
+            )
+        )
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        with self.assertRaises(sms_plusserver.CommunicationError):
+            service.put_sms('+4911122233344', 'Hello!')
+
+        mock_post.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_put_sms_retry_new_connection_error(self, mock_post, mock_sleep):
+        ok_response = mock.MagicMock(text='REQUEST OK\nhandle = abc')
+        mock_post.side_effect = [
+            requests.ConnectionError(
+                urllib3.exceptions.MaxRetryError(
+                    None,
+                    '/put.php',
+                    reason=urllib3.exceptions.NewConnectionError(
+                        None, 'Connection refused'
+                    ),
+                )
+            ),
+            ok_response,
+        ]
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        response = service.put_sms('+4911122233344', 'Hello!')
+
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertEqual(response.handle_id, 'abc')
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_check_sms_state_retry_connection_aborted(
+        self, mock_post, mock_sleep
+    ):
+        ok_response = mock.MagicMock(text='REQUEST OK\nstate = arrived')
+        mock_post.side_effect = [
+            requests.ConnectionError(
+                urllib3.exceptions.ProtocolError(
+                    'Connection aborted.', ConnectionResetError()
+                )
+            ),
+            ok_response,
+        ]
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        response = service.check_sms_state('d41d8cd98f00b204e9800998ecf8427e')
+
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertEqual(response.state, 'arrived')
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_request_retry_http_status(self, mock_post, mock_sleep):
+        error_response = mock.MagicMock(
+            status_code=503, headers={'Retry-After': '2'}
+        )
+        error_response.raise_for_status.side_effect = requests.HTTPError(
+            response=error_response
+        )
+        ok_response = mock.MagicMock(text='REQUEST OK\nhandle = abc')
+        mock_post.side_effect = [error_response, ok_response]
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        response = service.put_sms('+4911122233344', 'Hello!')
+
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once_with(2.0)
+        self.assertEqual(response.handle_id, 'abc')
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_put_sms_no_retry_gateway_error(self, mock_post, mock_sleep):
+        error_response = mock.MagicMock(status_code=504, headers={})
+        error_response.raise_for_status.side_effect = requests.HTTPError(
+            response=error_response
+        )
+        ok_response = mock.MagicMock(text='REQUEST OK\nhandle = abc')
+        mock_post.side_effect = [error_response, ok_response]
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        with self.assertRaises(sms_plusserver.RequestError):
+            service.put_sms('+4911122233344', 'Hello!')
+
+        mock_post.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_check_sms_state_retry_gateway_error(self, mock_post, mock_sleep):
+        error_response = mock.MagicMock(status_code=504, headers={})
+        error_response.raise_for_status.side_effect = requests.HTTPError(
+            response=error_response
+        )
+        ok_response = mock.MagicMock(text='REQUEST OK\nstate = arrived')
+        mock_post.side_effect = [error_response, ok_response]
+        service = sms_plusserver.SMSService(username='user', password='pass')
+
+        response = service.check_sms_state('d41d8cd98f00b204e9800998ecf8427e')
+
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertEqual(response.state, 'arrived')
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_request_no_retry_http_error(self, mock_post, mock_sleep):
+        for status_code in [401, 500]:
+            error_response = mock.MagicMock(
+                status_code=status_code, headers={}
+            )
+            error_response.raise_for_status.side_effect = requests.HTTPError(
+                response=error_response
+            )
+            mock_post.reset_mock()
+            mock_post.return_value = error_response
+            service = sms_plusserver.SMSService(
+                username='user', password='pass'
+            )
+
+            with self.assertRaises(sms_plusserver.RequestError):
+                service.put_sms('+4911122233344', 'Hello!')
+
+            mock_post.assert_called_once()
+            mock_sleep.assert_not_called()
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch(
+        'sms_plusserver.requests.Session.post',
+        side_effect=requests.ConnectionError,
+    )
+    def test_request_retry_disabled(self, mock_post, mock_sleep):
+        service = sms_plusserver.SMSService(
+            username='user', password='pass', max_retries=0
+        )
+
+        with self.assertRaises(sms_plusserver.CommunicationError):
+            service.put_sms('+4911122233344', 'Hello!')
+
+        mock_post.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @mock.patch(
+        'sms_plusserver.requests.Session.post',
+        side_effect=requests.ConnectionError,
+    )
+    def test_request_circuit_open(self, mock_post):
+        service = sms_plusserver.SMSService(
+            username='user', password='pass', max_retries=0
+        )
+        threshold = service.CIRCUIT_BREAKER_THRESHOLD
+        for _ in range(threshold):
+            with self.assertRaises(sms_plusserver.CommunicationError):
+                service.put_sms('+4911122233344', 'Hello!')
+
+        with self.assertRaises(sms_plusserver.CommunicationError) as raised:
+            service.put_sms('+4911122233344', 'Hello!')
+        self.assertIsNone(raised.exception.original_exception)
+        response = service.check_sms_state('abc', fail_silently=True)
+        self.assertIsNone(response)
+
+        self.assertEqual(mock_post.call_count, threshold)
+
+    def test_request_circuit_client_errors(self):
+        service = sms_plusserver.SMSService(
+            username='user', password='pass', put_url='localhost/put.php'
+        )
+        threshold = service.CIRCUIT_BREAKER_THRESHOLD
+        with mock.patch(
+            'sms_plusserver.requests.Session.post',
+            side_effect=requests.exceptions.MissingSchema,
+        ):
+            for _ in range(threshold):
+                with self.assertRaises(sms_plusserver.CommunicationError):
+                    service.put_sms('+4911122233344', 'Hello!')
+
+        with mock.patch('sms_plusserver.requests.Session.post') as mock_post:
+            type(mock_post.return_value).text = mock.PropertyMock(
+                return_value='REQUEST OK\nstate = arrived'
+            )
+            response = service.check_sms_state('abc')
+
+        mock_post.assert_called_once()
+        self.assertEqual(response.state, 'arrived')
+
+    def test_retry_delay(self):
+        service = sms_plusserver.SMSService(
+            retry_base_delay=1.0, retry_max_delay=5.0, retry_jitter=0.5
+        )
+        error = requests.ConnectionError()
+
+        for attempt, base_delay in enumerate([1.0, 2.0, 4.0, 5.0, 5.0]):
+            delay = service._get_retry_delay(attempt, error)
+            self.assertGreaterEqual(delay, base_delay * 0.5)
+            self.assertLessEqual(delay, base_delay * 1.5)
+
     # Tests for `check_sms_state` method:
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_check_sms_state_ok_default_params(self, mock_post):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value='REQUEST OK\nstate = arrived'
@@ -453,15 +1019,15 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             sms_plusserver.SMSService.SMS_STATE_URL,
-            {'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
-            auth=('user', 'pass'),
+            data={'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertIsInstance(response, sms_plusserver.SMSResponse)
         self.assertEqual(response.message, 'REQUEST OK')
         self.assertEqual(response.state, 'arrived')
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_check_sms_state_ok_custom_params(self, mock_post):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value='REQUEST OK\nstate = arrived'
@@ -476,15 +1042,15 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             sms_plusserver.SMSService.SMS_STATE_URL,
-            {'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
-            auth=('user', 'pass'),
+            data={'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=30,
         )
         self.assertIsInstance(response, sms_plusserver.SMSResponse)
         self.assertEqual(response.message, 'REQUEST OK')
         self.assertEqual(response.state, 'arrived')
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_check_sms_state_error_missing_credentials(self, mock_post):
         service = sms_plusserver.SMSService()
 
@@ -493,7 +1059,7 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_not_called()
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_check_sms_state_error_missing_handle_id(self, mock_post):
         service = sms_plusserver.SMSService(username='user', password='pass')
 
@@ -502,7 +1068,7 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_not_called()
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_check_sms_state_error_response(self, mock_post):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value='ERROR\nerror = Something is wrong'
@@ -516,16 +1082,18 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             sms_plusserver.SMSService.SMS_STATE_URL,
-            {'handle': 'unknownhandle'},
-            auth=('user', 'pass'),
+            data={'handle': 'unknownhandle'},
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertEqual(str(raised.exception), 'Something is wrong')
 
+    @mock.patch('sms_plusserver.time.sleep')
     @mock.patch(
-        'sms_plusserver.requests.post', side_effect=requests.ConnectTimeout
+        'sms_plusserver.requests.Session.post',
+        side_effect=requests.ConnectTimeout,
     )
-    def test_check_sms_state_error_network(self, mock_post):
+    def test_check_sms_state_error_network(self, mock_post, mock_sleep):
         service = sms_plusserver.SMSService(
             username='user', password='pass', project='TESTPROJECT'
         )
@@ -533,17 +1101,19 @@ class SMSServiceTestCase(unittest.TestCase):
         with self.assertRaises(sms_plusserver.CommunicationError) as raised:
             service.check_sms_state('d41d8cd98f00b204e9800998ecf8427e')
 
-        mock_post.assert_called_once_with(
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
+        mock_post.assert_called_with(
             sms_plusserver.SMSService.SMS_STATE_URL,
-            {'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
-            auth=('user', 'pass'),
+            data={'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertIsInstance(
             raised.exception.original_exception, requests.ConnectTimeout
         )
 
-    @mock.patch('sms_plusserver.requests.post')
+    @mock.patch('sms_plusserver.requests.Session.post')
     def test_check_sms_state_error_http(self, mock_post):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value='Something is wrong'
@@ -560,18 +1130,20 @@ class SMSServiceTestCase(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             sms_plusserver.SMSService.SMS_STATE_URL,
-            {'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
-            auth=('user', 'pass'),
+            data={'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertIsInstance(
             raised.exception.original_exception, requests.HTTPError
         )
 
+    @mock.patch('sms_plusserver.time.sleep')
     @mock.patch(
-        'sms_plusserver.requests.post', side_effect=requests.ConnectTimeout
+        'sms_plusserver.requests.Session.post',
+        side_effect=requests.ConnectTimeout,
     )
-    def test_check_sms_state_fail_silently(self, mock_post):
+    def test_check_sms_state_fail_silently(self, mock_post, mock_sleep):
         type(mock_post.return_value).text = mock.PropertyMock(
             return_value='REQUEST ERROR\nerror = Something is wrong'
         )
@@ -583,14 +1155,175 @@ class SMSServiceTestCase(unittest.TestCase):
             'd41d8cd98f00b204e9800998ecf8427e', fail_silently=True
         )
 
-        mock_post.assert_called_once_with(
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
+        mock_post.assert_called_with(
             sms_plusserver.SMSService.SMS_STATE_URL,
-            {'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
-            auth=('user', 'pass'),
+            data={'handle': 'd41d8cd98f00b204e9800998ecf8427e'},
+            headers={'Authorization': 'Basic dXNlcjpwYXNz'},
             timeout=None,
         )
         self.assertIsNone(response)
 
+    # Tests for `wait_until_arrived` method:
+
+    @mock.patch('sms_plusserver.random.uniform', return_value=0.0)
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch(
+        'sms_plusserver.SMSService.check_sms_state',
+        side_effect=[
+            sms_plusserver.SMSResponse('REQUEST OK\nstate = processed'),
+            sms_plusserver.SMSResponse('REQUEST OK\nstate = processed'),
+            sms_plusserver.SMSResponse('REQUEST OK\nstate = arrived'),
+        ],
+    )
+    def test_wait_until_arrived_backoff(
+        self, mock_check_sms_state, mock_sleep, mock_uniform
+    ):
+        service = sms_plusserver.SMSService()
+
+        response = service.wait_until_arrived(
+            'd41d8cd98f00b204e9800998ecf8427e'
+        )
+
+        self.assertEqual(mock_check_sms_state.call_count, 3)
+        self.assertEqual(
+            mock_sleep.call_args_list, [mock.call(0.5), mock.call(1.0)]
+        )
+        self.assertEqual(response.state, 'arrived')
+
+    def test_wait_until_arrived_timeout_includes_request_time(self):
+        clock = [0.0]
+
+        def check_sms_state(*args, **kwargs):
+            clock[0] += 1.0  # each state check takes 1 second
+            return sms_plusserver.SMSResponse('REQUEST OK\nstate = new')
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        service = sms_plusserver.SMSService(poll_schedule=[0.5])
+        with mock.patch.object(
+            service, 'check_sms_state', side_effect=check_sms_state
+        ) as mock_check_sms_state, mock.patch(
+            'sms_plusserver.time.sleep', side_effect=sleep
+        ), mock.patch(
+            'sms_plusserver.time.monotonic', side_effect=lambda: clock[0]
+        ):
+            response = service.wait_until_arrived('abc', timeout=2)
+
+        # No time left for a delay, the last check is made right away
+        self.assertEqual(mock_check_sms_state.call_count, 2)
+        self.assertEqual(clock[0], 2)
+        self.assertEqual(response.state, 'new')
+
+    def test_wait_until_arrived_timeout_includes_failed_requests(self):
+        clock = [0.0]
+
+        def post(*args, timeout=None, **kwargs):
+            clock[0] += timeout  # connection attempt times out
+            raise requests.ConnectTimeout
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        service = sms_plusserver.SMSService(username='user', password='pass')
+        with mock.patch(
+            'sms_plusserver.requests.Session.post', side_effect=post
+        ) as mock_post, mock.patch(
+            'sms_plusserver.time.sleep', side_effect=sleep
+        ), mock.patch(
+            'sms_plusserver.time.monotonic', side_effect=lambda: clock[0]
+        ):
+            response = service.wait_until_arrived('abc', timeout=2)
+
+        mock_post.assert_called_once()
+        self.assertEqual(clock[0], 2)
+        self.assertIsNone(response)
+
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch('sms_plusserver.requests.Session.post')
+    def test_wait_until_arrived_connection_error(self, mock_post, mock_sleep):
+        mock_post.side_effect = [
+            requests.ConnectionError,
+            mock.MagicMock(text='REQUEST OK\nstate = arrived'),
+        ]
+        service = sms_plusserver.SMSService(
+            username='user', password='pass', poll_schedule=[1]
+        )
+
+        response = service.wait_until_arrived('abc', timeout=10)
+
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once_with(1)
+        self.assertEqual(response.state, 'arrived')
+
+    def test_check_state_delay_poll_schedule(self):
+        service = sms_plusserver.SMSService(poll_schedule=[1, 5, 30])
+
+        delays = [service._get_check_state_delay(i) for i in range(5)]
+
+        self.assertEqual(delays, [1, 5, 30, 30, 30])
+
+    @mock.patch('sms_plusserver.random.uniform', return_value=0.0)
+    @mock.patch('sms_plusserver.time.sleep')
+    @mock.patch(
+        'sms_plusserver.SMSService.check_sms_state',
+        return_value=sms_plusserver.SMSResponse(
+            'REQUEST OK\nstate = processed'
+        ),
+    )
+    def test_wait_until_arrived_timeout(
+        self, mock_check_sms_state, mock_sleep, mock_uniform
+    ):
+        service = sms_plusserver.SMSService()
+
+        response = service.wait_until_arrived(
+            'd41d8cd98f00b204e9800998ecf8427e', timeout=2
+        )
+
+        # Delays of 0.5 and 0.5s (shortened from 1s), then a last check
+        # with 1s left before the deadline
+        self.assertEqual(mock_check_sms_state.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertAlmostEqual(
+            sum(call.args[0] for call in mock_sleep.call_args_list),
+            1,
+            places=2,
+        )
+        self.assertAlmostEqual(
+            mock_check_sms_state.call_args.kwargs['timeout'], 1, places=2
+        )
+        self.assertEqual(response.state, 'processed')
+
+    def test_wait_until_arrived_final_check_before_deadline(self):
+        clock = [0.0]
+        check_times = []
+
+        def check_sms_state(*args, **kwargs):
+            check_times.append(clock[0])
+            state = 'arrived' if clock[0] >= 8 else 'processed'
+            return sms_plusserver.SMSResponse(f'REQUEST OK\nstate = {state}')
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        service = sms_plusserver.SMSService(timeout=30)
+        service.CHECK_STATE_JITTER = 0
+        with mock.patch.object(
+            service, 'check_sms_state', side_effect=check_sms_state
+        ) as mock_check_sms_state, mock.patch(
+            'sms_plusserver.time.sleep', side_effect=sleep
+        ), mock.patch(
+            'sms_plusserver.time.monotonic', side_effect=lambda: clock[0]
+        ):
+            response = service.wait_until_arrived('abc', timeout=10)
+
+        self.assertEqual(check_times, [0, 0.5, 1.5, 3.5, 7.5, 9])
+        self.assertEqual(mock_check_sms_state.call_args.kwargs['timeout'], 1)
+        self.assertEqual(clock[0], 9)
+        self.assertEqual(response.state, 'arrived')
+
     # Tests for `send` method:
 
     @mock.patch(
@@ -679,6 +1412,61 @@ class SMSServiceTestCase(unittest.TestCase):
         )
         self.assertIsNone(sms.put_response)
 
+    # Tests for `send_many` method:
+
+    @mock.patch('sms_plusserver.SMSService.put_sms')
+    def test_send_many(self, mock_put_sms):
+        mock_put_sms.side_effect = lambda destination, **kwargs: (
+            sms_plusserver.SMSResponse(f'REQUEST OK\nhandle = {destination}')
+        )
+        service = sms_plusserver.SMSService()
+        sms_list = [
+            sms_plusserver.SMS(f'+49111222333{i:02}', 'Hello!')
+            for i in range(10)
+        ]
+
+        results = service.send_many(sms_list, concurrency=4)
+
+        self.assertEqual(mock_put_sms.call_count, 10)
+        self.assertEqual(results, [sms.destination for sms in sms_list])
+        for sms in sms_list:
+            self.assertEqual(sms.handle_id, sms.destination)
+
+    @mock.patch(
+        'sms_plusserver.ThreadPoolExecutor',
+        wraps=sms_plusserver.ThreadPoolExecutor,
+    )
+    @mock.patch('sms_plusserver.SMSService.send', return_value=True)
+    def test_send_many_concurrency_limit(self, mock_send, mock_executor):
+        service = sms_plusserver.SMSService()
+        sms_list = [sms_plusserver.SMS('+4911122233344', 'Hello!')]
+
+        results = service.send_many(sms_list, concurrency=1000)
+
+        mock_executor.assert_called_once_with(
+            max_workers=sms_plusserver.SMSService.POOL_MAXSIZE
+        )
+        self.assertEqual(results, [True])
+
+    @mock.patch('sms_plusserver.SMSService.put_sms')
+    def test_send_many_error(self, mock_put_sms):
+        error = sms_plusserver.RequestError('Error occurred')
+        mock_put_sms.side_effect = [
+            sms_plusserver.SMSResponse('REQUEST OK\nhandle = abc'),
+            error,
+        ]
+        service = sms_plusserver.SMSService()
+        sms_list = [
+            sms_plusserver.SMS('+4911122233344', 'Hello!'),
+            sms_plusserver.SMS('+4911122233355', 'Hello!'),
+        ]
+
+        results = service.send_many(sms_list, concurrency=1)
+
+        self.assertEqual(results, ['abc', error])
+        self.assertEqual(sms_list[0].handle_id, 'abc')
+        self.assertIsNone(sms_list[1].put_response)
+
     # Tests for `check_state` method:
 
     @mock.patch(
@@ -810,6 +1598,11 @@ class SMSTestCase(unittest.TestCase):
             repr(sms), f'<SMS +4911122233344 [{handle_id}] processed>'
         )
 
+    def test_no_instance_dict(self):
+        sms = sms_plusserver.SMS('+4911122233344', 'Hello!')
+        with self.assertRaises(AttributeError):
+            sms.extra = 42
+
     # Tests for `send` method:
 
     @mock.patch('sms_plusserver.SMSService.send')
@@ -832,7 +1625,7 @@ class SMSTestCase(unittest.TestCase):
 
     @mock.patch('sms_plusserver.SMSService.send')
     def test_send_custom_service(self, mock_send):
-        mock_service = mock.MagicMock()
+        mock_service = mock.Mock(spec=sms_plusserver.SMSService)
         sms = sms_plusserver.SMS('+4911122233344', 'Hello!')
 
         sms.send(service=mock_service)
@@ -866,7 +1659,7 @@ class SMSTestCase(unittest.TestCase):
 
     @mock.patch('sms_plusserver.SMSService.check_state')
     def test_check_state_custom_service(self, mock_check_state):
-        mock_service = mock.MagicMock()
+        mock_service = mock.Mock(spec=sms_plusserver.SMSService)
         sms = sms_plusserver.SMS('+4911122233344', 'Hello!')
 
         sms.check_state(service=mock_service)
@@ -974,12 +1767,102 @@ class FunctionsTestCase(unittest.TestCase):
         self.assertTrue(success)
 
     def test_send_sms_custom_service(self):
-        mock_service = mock.MagicMock()
+        mock_service = mock.Mock(spec=sms_plusserver.SMSService)
         sms_plusserver.send_sms(
             '+4911122233344', 'Hello!', service=mock_service
         )
         mock_service.send.assert_called_once()
 
+    # Tests for `send_bulk_sms`:
+
+    @mock.patch('sms_plusserver.SMSService.send_many')
+    def test_send_bulk_sms_default_params(self, mock_send_many):
+        sms_list = [sms_plusserver.SMS('+4911122233344', 'Hello!')]
+
+        sms_plusserver.send_bulk_sms(sms_list)
+
+        mock_send_many.assert_called_once_with(
+            sms_list, concurrency=16, timeout=None, fail_silently=False
+        )
+
+    def test_send_bulk_sms_custom_service(self):
+        mock_service = mock.Mock(spec=sms_plusserver.SMSService)
+        sms_list = [sms_plusserver.SMS('+4911122233344', 'Hello!')]
+
+        sms_plusserver.send_bulk_sms(
+            sms_list,
+            concurrency=4,
+            timeout=30,
+            fail_silently=True,
+            service=mock_service,
+        )
+
+        mock_service.send_many.assert_called_once_with(
+            sms_list, concurrency=4, timeout=30, fail_silently=True
+        )
+
+    # Tests for `send_sms_async`:
+
+    def test_send_sms_async(self):
+        mock_service = mock.Mock(spec=sms_plusserver.SMSService)
+        mock_service.send.return_value = 'd41d8cd98f00b204e9800998ecf8427e'
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        handle_id = loop.run_until_complete(
+            sms_plusserver.send_sms_async(
+                '+4911122233344', 'Hello!', timeout=30, service=mock_service
+            )
+        )
+
+        mock_service.send.assert_called_once()
+        self.assertEqual(
+            mock_service.send.call_args[1],
+            {'timeout': 30, 'fail_silently': False},
+        )
+        self.assertEqual(handle_id, 'd41d8cd98f00b204e9800998ecf8427e')
+
+    def test_send_sms_async_error(self):
+        mock_service = mock.Mock(spec=sms_plusserver.SMSService)
+        mock_service.send.side_effect = sms_plusserver.CommunicationError(
+            'Network error'
+        )
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        with self.assertRaises(sms_plusserver.CommunicationError):
+            loop.run_until_complete(
+                sms_plusserver.send_sms_async(
+                    '+4911122233344', 'Hello!', service=mock_service
+                )
+            )
+
+    # Tests for `check_sms_state_async`:
+
+    def test_check_sms_state_async(self):
+        mock_service = mock.Mock(spec=sms_plusserver.SMSService)
+        state_response = sms_plusserver.SMSResponse(
+            'REQUEST OK\nstate = arrived'
+        )
+        mock_service.check_sms_state.return_value = state_response
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        state = loop.run_until_complete(
+            sms_plusserver.check_sms_state_async(
+                'd41d8cd98f00b204e9800998ecf8427e',
+                fail_silently=True,
+                service=mock_service,
+            )
+        )
+
+        mock_service.check_sms_state.assert_called_once_with(
+            'd41d8cd98f00b204e9800998ecf8427e',
+            timeout=None,
+            fail_silently=True,
+        )
+        self.assertEqual(state, 'arrived')
+
     # Tests for `check_sms_state`:
 
     @mock.patch(
@@ -1013,7 +1896,7 @@ class FunctionsTestCase(unittest.TestCase):
         self.assertEqual(state, 'arrived')
 
     def test_check_sms_state_custom_service(self):
-        mock_service = mock.MagicMock()
+        mock_service = mock.Mock(spec=sms_plusserver.SMSService)
         sms_plusserver.check_sms_state(
             'd41d8cd98f00b204e9800998ecf8427e', service=mock_service
         )
@@ -1034,6 +1917,8 @@ class FunctionsTestCase(unittest.TestCase):
             'd41d8cd98f00b204e9800998ecf8427e',
             timeout=None,
             fail_silently=False,
+            use_cache=False,
+            max_retries=0,
         )
         self.assertEqual(state, 'arrived')
 
@@ -1050,11 +1935,13 @@ class FunctionsTestCase(unittest.TestCase):
             'd41d8cd98f00b204e9800998ecf8427e',
             timeout=30,
             fail_silently=False,  # this param is not propagated
+            use_cache=False,
+            max_retries=0,
         )
         self.assertEqual(state, 'arrived')
 
     def test_wait_until_arrived_custom_service(self):
-        mock_service = mock.MagicMock()
+        mock_service = mock.Mock(spec=sms_plusserver.SMSService)
         sms_plusserver.wait_until_arrived(
             'd41d8cd98f00b204e9800998ecf8427e', service=mock_service
         )